@@ -1,6 +1,7 @@
 """Entry point."""
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from environs import Env
 from loguru import logger
@@ -27,6 +28,7 @@ def main() -> None:
     env.read_env()
     config = RevancedConfig(env)
     updates_info = {}
+    Downloader.warm_up_connections(config)
     Downloader.extra_downloads(config)
     if not config.dry_run:
         check_java()
@@ -34,27 +36,37 @@ def main() -> None:
         updates_info = load_older_updates(env)
 
     logger.info(f"Will Patch only {config.apps}")
-    for possible_app in config.apps:
-        logger.info(f"Trying to build {possible_app}")
-        try:
-            app = get_app(config, possible_app)
-            app.download_patch_resources(config)
-            patcher = Patches(config, app)
-            parser = Parser(patcher, config)
-            app_all_patches = patcher.get_app_configs(app)
-            app.download_apk_for_patching(config)
-            parser.include_exclude_patch(app, app_all_patches, patcher.patches_dict)
-            logger.info(app)
-            updates_info = save_patch_info(app, updates_info)
-            parser.patch_app(app)
-        except AppNotFoundError as e:
-            logger.info(e)
-        except PatchesJsonLoadError:
-            logger.exception("Patches.json not found")
-        except PatchingFailedError as e:
-            logger.exception(e)
-        except BuilderError as e:
-            logger.exception(f"Failed to build {possible_app} because of {e}")
+    with ThreadPoolExecutor(config.max_parallel_patches) as executor:
+        patch_futures: dict[Future[None], str] = {}
+        for possible_app in config.apps:
+            logger.info(f"Trying to build {possible_app}")
+            try:
+                app = get_app(config, possible_app)
+                app.download_patch_resources(config)
+                patcher = Patches(config, app)
+                parser = Parser(patcher, config)
+                app_all_patches = patcher.get_app_configs(app)
+                app.download_apk_for_patching(config)
+                parser.include_exclude_patch(app, app_all_patches, patcher.patches_dict)
+                parser.freeze()
+                logger.info(app)
+                updates_info = save_patch_info(app, updates_info)
+                patch_futures[executor.submit(parser.patch_app, app)] = possible_app
+            except AppNotFoundError as e:
+                logger.info(e)
+            except PatchesJsonLoadError:
+                logger.exception("Patches.json not found")
+            except PatchingFailedError as e:
+                logger.exception(e)
+            except BuilderError as e:
+                logger.exception(f"Failed to build {possible_app} because of {e}")
+        for future in as_completed(patch_futures):
+            try:
+                future.result()
+            except PatchingFailedError as e:
+                logger.exception(e)
+            except BuilderError as e:
+                logger.exception(f"Failed to build {patch_futures[future]} because of {e}")
     write_changelog_to_file(updates_info)
 
 
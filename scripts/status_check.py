@@ -2,6 +2,7 @@
 
 import re
 from pathlib import Path
+from typing import Any
 
 import requests
 from bs4 import BeautifulSoup, Tag
@@ -28,7 +29,14 @@ from src.exceptions import (
     ScrapingError,
 )
 from src.patches import Patches
-from src.utils import apkmirror_status_check, bs4_parser, handle_request_response, request_header, request_timeout
+from src.utils import (
+    apkmirror_bulk_status_check,
+    apkmirror_status_check,
+    bs4_parser,
+    handle_request_response,
+    request_header,
+    request_timeout,
+)
 
 no_of_col = 8
 combo_headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/116.0"}
@@ -91,11 +99,12 @@ def apkmonk_scrapper(package_name: str) -> str:
     raise APKMonkIconScrapError(url=apkmonk_url)
 
 
-def apkmirror_scrapper(package_name: str) -> str:
+def apkmirror_scrapper(package_name: str, app_status: dict[str, Any] | None = None) -> str:
     """Apkmirror URL."""
-    response = apkmirror_status_check(package_name)
+    if not app_status:
+        app_status = apkmirror_status_check(package_name)["data"][0]
     search_url = APK_MIRROR_PACKAGE_URL.format(package_name)
-    if response["data"][0]["exists"]:
+    if app_status["exists"]:
         return _extracted_from_apkmirror_scrapper(search_url)
     raise APKMirrorIconScrapError(url=search_url)
 
@@ -147,7 +156,7 @@ def apkpure_scrapper(package_name: str) -> str:
         raise APKPureIconScrapError(url=apkpure_url) from e
 
 
-def icon_scrapper(package_name: str) -> str:
+def icon_scrapper(package_name: str, apkmirror_app_status: dict[str, Any] | None = None) -> str:
     """Scrap Icon."""
     scraper_names = {
         "gplay_icon_scrapper": GooglePlayScraperException,
@@ -156,10 +165,11 @@ def icon_scrapper(package_name: str) -> str:
         "apkpure_scrapper": APKPureIconScrapError,
         "apkcombo_scrapper": APKComboIconScrapError,
     }
+    scraper_kwargs = {"apkmirror_scrapper": {"app_status": apkmirror_app_status}}
 
     for scraper_name, error_type in scraper_names.items():
         try:
-            return str(globals()[scraper_name](package_name))
+            return str(globals()[scraper_name](package_name, **scraper_kwargs.get(scraper_name, {})))
         except error_type:
             pass
         except ScrapingError:
@@ -202,11 +212,15 @@ def main() -> None:
 
     supported_app = set(Patches.support_app().keys())
     missing_support = sorted(possible_apps.difference(supported_app))
+    try:
+        apkmirror_status = apkmirror_bulk_status_check(missing_support)
+    except (BuilderError, KeyError, ValueError, requests.RequestException):
+        apkmirror_status = {}
     output = "New app found which aren't supported.\n\n"
     data = [
         [
             app,
-            f'<img src="{icon_scrapper(app)}" width=50 height=50>',
+            f'<img src="{icon_scrapper(app, apkmirror_status.get(app))}" width=50 height=50>',
             f"[PlayStore Link]({PLAY_STORE_APK_URL.format(app)})",
             f"[APKMirror Link]({APK_MIRROR_PACKAGE_URL.format(app)})",
             f"[APKMonk Link]({APK_MONK_APK_URL.format(app)})",
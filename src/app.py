@@ -3,9 +3,11 @@
 import concurrent
 import hashlib
 import pathlib
+import warnings
 import datetime as dt
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Self
 
 from loguru import logger
@@ -14,12 +16,16 @@ from pytz import timezone
 from src.config import RevancedConfig
 from src.downloader.sources import apk_sources
 from src.exceptions import BuilderError, DownloadError, PatchingFailedError
-from src.utils import slugify, time_zone
+from src.utils import possible_archs, slugify, time_zone
 
 
 class APP(object):
     """Patched APK."""
 
+    # Values derived from the app config for building cli args. `output_file_name` is a cached_property, so it
+    # lands in __dict__ once read; neither belongs in the app dump saved to updates.json.
+    _derived_attrs = frozenset(("rip_lib_args", "output_file_name"))
+
     def __init__(self: Self, app_name: str, package_name: str, config: RevancedConfig) -> None:
         """Initialize APP.
 
@@ -41,8 +47,18 @@ class APP(object):
         self.no_of_patches: int = 0
         self.keystore_name = config.env.str(f"{app_name}_KEYSTORE_FILE_NAME".upper(), config.global_keystore_name)
         self.archs_to_build = config.env.list(f"{app_name}_ARCHS_TO_BUILD".upper(), config.global_archs_to_build)
+        self.rip_lib_args: tuple[str, ...] = (
+            tuple(
+                arg
+                for arch in possible_archs - frozenset(self.archs_to_build)
+                for arg in ("--rip-lib", arch)
+            )
+            if app_name in config.rip_libs_apps
+            else ()
+        )
         self.options_file = config.env.str(f"{app_name}_OPTIONS_FILE".upper(), config.global_options_file)
         self.download_file_name = ""
+        self.patch_date = dt.datetime.now().strftime("%y%m%d")
         self.download_dl = config.env.str(f"{app_name}_DL".upper(), "")
         self.download_source = config.env.str(f"{app_name}_DL_SOURCE".upper(), "")
         self.package_name = package_name
@@ -74,24 +90,43 @@ class APP(object):
             downloader = DownloaderFactory.create_downloader(config=config, apk_source=self.download_source)
             self.download_file_name, self.download_dl = downloader.download(self.app_version, self)
 
-    def get_output_file_name(self: Self) -> str:
-        """The function returns a string representing the output file name.
+    def source_urls(self: Self) -> list[str]:
+        """The function returns the urls the apk and patching resources will be downloaded from.
+
+        Returns
+        -------
+            a list of urls, honouring the app level download overrides.
+        """
+        apk_url = self.download_dl or self.download_source or apk_sources.get(self.app_name, "")
+        return [apk_url, self.cli_dl, self.patches_dl, self.integrations_dl, self.patches_json_dl]
+
+    @cached_property
+    def output_file_name(self: Self) -> str:
+        """The property returns a string representing the output file name.
 
         Returns
         -------
             a string that represents the output file name for an APK file.
         """
-        self.patch_date = dt.datetime.now().strftime("%y%m%d")
         return f"{self.app_name}-revanced-v{self.app_version}_{self.patch_date}.apk"
 
+    def get_output_file_name(self: Self) -> str:
+        """Deprecated, use the `output_file_name` property instead."""
+        warnings.warn(
+            "APP.get_output_file_name() is deprecated, use APP.output_file_name instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.output_file_name
+
     def __str__(self: "APP") -> str:
         """Returns the str representation of the app."""
-        attrs = vars(self)
+        attrs = self.for_dump()
         return ", ".join([f"{key}: {value}" for key, value in attrs.items()])
 
     def for_dump(self: Self) -> dict[str, Any]:
-        """Convert the instance of this class to json."""
-        return self.__dict__
+        """Convert the instance of this class to json, leaving out values derived for patching."""
+        return {key: value for key, value in self.__dict__.items() if key not in self._derived_attrs}
 
     @staticmethod
     def download(url: str, config: RevancedConfig, assets_filter: str, file_name: str = "") -> tuple[str, str]:
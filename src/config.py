@@ -1,5 +1,6 @@
 """Revanced Configurations."""
 
+import os
 from pathlib import Path
 from typing import Self
 
@@ -40,3 +41,4 @@ class RevancedConfig(object):
         self.apps = env.list("PATCH_APPS", default_build)
         self.global_old_key = env.bool("GLOBAL_OLD_KEY", True)
         self.global_space_formatted = env.bool("GLOBAL_SPACE_FORMATTED_PATCHES", True)
+        self.max_parallel_patches = max(1, env.int("MAX_PARALLEL_PATCHES", (os.cpu_count() or 1) // 2))
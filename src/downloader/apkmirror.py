@@ -2,7 +2,6 @@
 
 from typing import Any, Self
 
-import requests
 from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
@@ -10,7 +9,15 @@ from src.app import APP
 from src.downloader.download import Downloader
 from src.downloader.sources import APK_MIRROR_BASE_URL
 from src.exceptions import APKMirrorAPKDownloadError, ScrapingError
-from src.utils import bs4_parser, contains_any_word, handle_request_response, request_header, request_timeout, slugify
+from src.utils import (
+    bs4_parser,
+    contains_any_word,
+    handle_request_response,
+    request_header,
+    request_timeout,
+    session,
+    slugify,
+)
 
 
 class ApkMirror(Downloader):
@@ -78,7 +85,7 @@ class ApkMirror(Downloader):
     @staticmethod
     def _extract_source(url: str) -> str:
         """Extracts the source from the url incase of reuse."""
-        response = requests.get(url, headers=request_header, timeout=request_timeout)
+        response = session.get(url, headers=request_header, timeout=request_timeout)
         handle_request_response(response, url)
         return response.text
 
@@ -3,7 +3,6 @@
 import re
 from typing import Any, Self
 
-import requests
 from bs4 import BeautifulSoup
 
 from scripts.status_check import combo_headers
@@ -11,7 +10,7 @@ from src.app import APP
 from src.downloader.download import Downloader
 from src.downloader.sources import APK_MONK_BASE_URL
 from src.exceptions import APKMonkAPKDownloadError
-from src.utils import bs4_parser, handle_request_response, request_header, request_timeout
+from src.utils import bs4_parser, handle_request_response, request_header, request_timeout, session
 
 
 class ApkMonk(Downloader):
@@ -24,7 +23,7 @@ class ApkMonk(Downloader):
         :param app: Name of the app
         """
         file_name = f"{app}.apk"
-        r = requests.get(page, headers=request_header, allow_redirects=True, timeout=request_timeout)
+        r = session.get(page, headers=request_header, allow_redirects=True, timeout=request_timeout)
         handle_request_response(r, page)
         soup = BeautifulSoup(r.text, bs4_parser)
         download_scripts = soup.find_all("script", type="text/javascript")
@@ -43,7 +42,7 @@ class ApkMonk(Downloader):
                 url=page,
             )
         request_header["User-Agent"] = combo_headers["User-Agent"]
-        r = requests.get(url, headers=request_header, allow_redirects=True, timeout=request_timeout)
+        r = session.get(url, headers=request_header, allow_redirects=True, timeout=request_timeout)
         handle_request_response(r, url)
         final_download_url = r.json()["url"]
         self._download(final_download_url, file_name)
@@ -57,7 +56,7 @@ class ApkMonk(Downloader):
         :param main_page: Version of the application to download
         :return: Version of downloaded apk
         """
-        r = requests.get(app.download_source, headers=request_header, allow_redirects=True, timeout=request_timeout)
+        r = session.get(app.download_source, headers=request_header, allow_redirects=True, timeout=request_timeout)
         handle_request_response(r, app.download_source)
         soup = BeautifulSoup(r.text, bs4_parser)
         version_table = soup.find_all(class_="striped")
@@ -80,7 +79,7 @@ class ApkMonk(Downloader):
         :param app: Name of the application
         :return: Version of downloaded apk
         """
-        r = requests.get(app.download_source, headers=request_header, allow_redirects=True, timeout=request_timeout)
+        r = session.get(app.download_source, headers=request_header, allow_redirects=True, timeout=request_timeout)
         handle_request_response(r, app.download_source)
         soup = BeautifulSoup(r.text, bs4_parser)
         latest_download_url = soup.find(id="download_button")["href"]  # type: ignore[index]
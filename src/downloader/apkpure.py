@@ -2,14 +2,13 @@
 
 from typing import Any, Self
 
-import requests
 from bs4 import BeautifulSoup
 from loguru import logger
 
 from src.app import APP
 from src.downloader.download import Downloader
 from src.exceptions import APKPureAPKDownloadError
-from src.utils import bs4_parser, handle_request_response, request_header, request_timeout, slugify
+from src.utils import bs4_parser, handle_request_response, request_header, request_timeout, session, slugify
 
 
 class ApkPure(Downloader):
@@ -70,7 +69,7 @@ class ApkPure(Downloader):
         from functools import cmp_to_key
 
         logger.debug(f"Extracting download link from\n{page}")
-        r = requests.get(page, headers=request_header, timeout=request_timeout)
+        r = session.get(page, headers=request_header, timeout=request_timeout)
         handle_request_response(r, page)
         soup = BeautifulSoup(r.text, bs4_parser)
         apks = soup.select("#version-list a.download-btn")
@@ -102,7 +101,7 @@ class ApkPure(Downloader):
         """
         self.global_archs_priority = tuple(self._sort_by_priority(app.archs_to_build))
         version_page = app.download_source + "/versions"
-        r = requests.get(version_page, headers=request_header, timeout=request_timeout)
+        r = session.get(version_page, headers=request_header, timeout=request_timeout)
         handle_request_response(r, version_page)
         soup = BeautifulSoup(r.text, bs4_parser)
         version_box_list = soup.select("ul.ver-wrap > *")
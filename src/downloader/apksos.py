@@ -2,13 +2,12 @@
 
 from typing import Any, Self
 
-import requests
 from bs4 import BeautifulSoup
 
 from src.app import APP
 from src.downloader.download import Downloader
 from src.exceptions import APKSosAPKDownloadError
-from src.utils import bs4_parser, handle_request_response, request_header, request_timeout
+from src.utils import bs4_parser, handle_request_response, request_header, request_timeout, session
 
 
 class ApkSos(Downloader):
@@ -20,7 +19,7 @@ class ApkSos(Downloader):
         :param page: Url of the page
         :param app: Name of the app
         """
-        r = requests.get(page, headers=request_header, allow_redirects=True, timeout=request_timeout)
+        r = session.get(page, headers=request_header, allow_redirects=True, timeout=request_timeout)
         handle_request_response(r, page)
         soup = BeautifulSoup(r.text, bs4_parser)
         download_button = soup.find(class_="col-sm-12 col-md-8 text-center")
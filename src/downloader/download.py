@@ -1,17 +1,22 @@
 """Downloader Class."""
 
 import os
+import socket
 import subprocess
 from pathlib import Path
 from queue import PriorityQueue
+from threading import Thread
 from time import perf_counter
 from typing import Any, Self
+from urllib.parse import urlsplit
 
+import requests
 from loguru import logger
 from tqdm import tqdm
 
 from src.app import APP
 from src.config import RevancedConfig
+from src.downloader.sources import GITHUB_API_BASE_URL, GITHUB_BASE_URL
 from src.exceptions import DownloadError
 from src.utils import handle_request_response, implement_method, session
 
@@ -156,3 +161,40 @@ class Downloader(object):
                 )
         except (ValueError, IndexError):
             logger.info("Unable to download extra file. Provide input in url@name.apk format.")
+
+    @staticmethod
+    def _warm_up_host(host: str) -> None:
+        """Resolve a host and open a pooled connection to it, ignoring any failure."""
+        try:
+            socket.getaddrinfo(host, 443)
+            session.head(f"https://{host}/", timeout=2)
+        except (OSError, requests.RequestException) as e:
+            logger.debug(f"Unable to warm up connection to {host}: {e}")
+
+    @staticmethod
+    def warm_up_connections(config: RevancedConfig) -> None:
+        """The function `warm_up_connections` pre-resolves and connects to the hosts apps will be downloaded from.
+
+        The warm up runs in background daemon threads and is never waited on, so a slow resolver
+        cannot delay the build.
+
+        Parameters
+        ----------
+        config : RevancedConfig
+            The `config` parameter is an instance of the `RevancedConfig` class. It is used to provide
+        the apps to be patched, their download sources and the dry run setting.
+        """
+        if config.dry_run:
+            return
+        # Package name only matters for scraping, not for finding the hosts to connect to.
+        hosts = {
+            parsed_url.netloc
+            for app_name in config.apps
+            for url in APP(app_name=app_name, package_name="", config=config).source_urls()
+            if (parsed_url := urlsplit(url.strip())).scheme in ("http", "https") and parsed_url.netloc
+        }
+        if urlsplit(GITHUB_BASE_URL).netloc in hosts:
+            # GitHub resources are resolved through the API before the asset itself is downloaded.
+            hosts.add(urlsplit(GITHUB_API_BASE_URL).netloc)
+        for host in hosts:
+            Thread(target=Downloader._warm_up_host, args=(host,), daemon=True).start()
@@ -4,15 +4,15 @@ import re
 from typing import Self
 from urllib.parse import urlparse
 
-import requests
 from lastversion import latest
 from loguru import logger
 
 from src.app import APP
 from src.config import RevancedConfig
 from src.downloader.download import Downloader
+from src.downloader.sources import GITHUB_API_BASE_URL
 from src.exceptions import DownloadError
-from src.utils import handle_request_response, request_timeout, update_changelog
+from src.utils import handle_request_response, request_timeout, session, update_changelog
 
 
 class Github(Downloader):
@@ -29,14 +29,14 @@ class Github(Downloader):
             return app.app_name, f"local://{app.app_name}"
         owner = str(kwargs["owner"])
         repo_name = str(kwargs["name"])
-        repo_url = f"https://api.github.com/repos/{owner}/{repo_name}/releases/latest"
+        repo_url = f"{GITHUB_API_BASE_URL}/repos/{owner}/{repo_name}/releases/latest"
         headers = {
             "Content-Type": "application/vnd.github.v3+json",
         }
         if self.config.personal_access_token:
             logger.debug("Using personal access token")
             headers["Authorization"] = f"token {self.config.personal_access_token}"
-        response = requests.get(repo_url, headers=headers, timeout=request_timeout)
+        response = session.get(repo_url, headers=headers, timeout=request_timeout)
         handle_request_response(response, repo_url)
         if repo_name == "revanced-patches":
             download_url = response.json()["assets"][1]["browser_download_url"]
@@ -75,13 +75,13 @@ class Github(Downloader):
         config: RevancedConfig,
     ) -> tuple[str, str]:
         """Get assets from given tag."""
-        api_url = f"https://api.github.com/repos/{github_repo_owner}/{github_repo_name}/releases/{release_tag}"
+        api_url = f"{GITHUB_API_BASE_URL}/repos/{github_repo_owner}/{github_repo_name}/releases/{release_tag}"
         headers = {
             "Content-Type": "application/vnd.github.v3+json",
         }
         if config.personal_access_token:
             headers["Authorization"] = f"token {config.personal_access_token}"
-        response = requests.get(api_url, headers=headers, timeout=request_timeout)
+        response = session.get(api_url, headers=headers, timeout=request_timeout)
         handle_request_response(response, api_url)
         update_changelog(f"{github_repo_owner}/{github_repo_name}", response.json())
         assets = response.json()["assets"]
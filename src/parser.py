@@ -1,7 +1,10 @@
 """Revanced Parser."""
 
-from pathlib import Path
+import re
+from contextlib import nullcontext
+from io import TextIOWrapper
 from subprocess import PIPE, Popen
+from threading import Lock
 from time import perf_counter
 from typing import Self
 
@@ -11,7 +14,6 @@ from src.app import APP
 from src.config import RevancedConfig
 from src.exceptions import PatchingFailedError
 from src.patches import Patches
-from src.utils import possible_archs
 
 
 class Parser(object):
@@ -25,10 +27,14 @@ class Parser(object):
     OUTPUT_ARG = "-o"
     KEYSTORE_ARG = "--keystore"
     OPTIONS_ARG = "--options"
+    # Cli before v4 keep their resource cache relative to the working directory, so they cannot run concurrently.
+    SHARED_CACHE_CLI_LOCK = Lock()
+    SEPARATE_CACHE_CLI_MAJOR = 4
 
     def __init__(self: Self, patcher: Patches, config: RevancedConfig) -> None:
         self._PATCHES: list[str] = []
         self._EXCLUDED: list[str] = []
+        self._patches_frozen: tuple[str, ...] | None = None
         self.patcher = patcher
         self.config = config
 
@@ -84,25 +90,28 @@ class Parser(object):
             a boolean value. It returns True if the patch name is found in the list of patches and
         successfully inverted, and False if the patch name is not found in the list.
         """
-        try:
-            name = name.lower().replace(" ", "-")
-            patch_index = self._PATCHES.index(name)
-            indices = [i for i in range(len(self._PATCHES)) if self._PATCHES[i] == name]
-            for patch_index in indices:
-                if self._PATCHES[patch_index - 1] == "-e":
-                    self._PATCHES[patch_index - 1] = "-i"
-                else:
-                    self._PATCHES[patch_index - 1] = "-e"
-        except ValueError:
-            return False
-        else:
-            return True
+        name = name.lower().replace(" ", "-")
+        found = False
+        patches = self._PATCHES
+        for patch_index in range(1, len(patches)):
+            if patches[patch_index] == name:
+                patches[patch_index - 1] = "-i" if patches[patch_index - 1] == "-e" else "-e"
+                found = True
+        return found
 
     def exclude_all_patches(self: Self) -> None:
         """The function `exclude_all_patches` exclude all the patches."""
-        for idx, item in enumerate(self._PATCHES):
-            if item == "-i":
-                self._PATCHES[idx] = "-e"
+        self._PATCHES = ["-e" if item == "-i" else item for item in self._PATCHES]
+
+    def freeze(self: Self) -> tuple[str, ...]:
+        """The function `freeze` snapshots the configured patches once patch selection is complete.
+
+        Returns
+        -------
+            the frozen tuple of patch arguments.
+        """
+        self._patches_frozen = tuple(self._PATCHES)
+        return self._patches_frozen
 
     def include_exclude_patch(
         self: Self,
@@ -135,9 +144,11 @@ class Parser(object):
                 )
             for patch in patches_dict["universal_patch"]:
                 self.include(patch["name"]) if patch["name"] in app.include_request else ()
+        if self.config.ci_test:
+            self.exclude_all_patches()
 
     @staticmethod
-    def is_new_cli(cli_path: Path) -> tuple[bool, str]:
+    def is_new_cli(cli_path: str) -> tuple[bool, str]:
         """Check if new cli is being used."""
         process = Popen(["java", "-jar", cli_path, "-V"], stdout=PIPE)
         output = process.stdout
@@ -151,66 +162,119 @@ class Parser(object):
         logger.debug("Old cli")
         return False, combined_result
 
+    @classmethod
+    def uses_shared_cache(cls: type[Self], version: str) -> bool:
+        """Check if the cli keeps its resource cache in the working directory, i.e. it is older than v4."""
+        if match := re.search(r"v(\d+)\.", version):
+            return int(match.group(1)) < cls.SEPARATE_CACHE_CLI_MAJOR
+        return True
+
     # noinspection IncorrectFormatting
-    def patch_app(
+    def build_args(
         self: Self,
         app: APP,
-    ) -> None:
-        """The function `patch_app` is used to patch an app using the Revanced CLI tool.
+        cli_path: str,
+        is_new: bool,
+        version: str,
+    ) -> tuple[str, ...]:
+        """The function `build_args` builds the Revanced CLI arguments needed to patch an app.
 
         Parameters
         ----------
         app : APP
             The `app` parameter is an instance of the `APP` class. It represents an application that needs
         to be patched.
+        cli_path : str
+            The `cli_path` parameter is the path of the Revanced CLI jar.
+        is_new : bool
+            The `is_new` parameter tells whether the CLI uses the new (v3+) command line, as returned by
+        `is_new_cli`.
+        version : str
+            The `version` parameter is the version output of the CLI, as returned by `is_new_cli`.
+
+        Returns
+        -------
+            a tuple of arguments to be passed to `java`.
         """
-        is_new, version = self.is_new_cli(self.config.temp_folder.joinpath(app.resource["cli"]["file_name"]))
+        temp_folder = self.config.temp_folder
         if is_new:
             apk_arg = self.NEW_APK_ARG
             exp = "--force"
         else:
             apk_arg = self.APK_ARG
             exp = "--experimental"
-        args = [
+        args: tuple[str, ...] = (
             self.CLI_JAR,
-            app.resource["cli"]["file_name"],
+            cli_path,
             apk_arg,
-            app.download_file_name,
+            str(temp_folder / app.download_file_name),
             self.PATCHES_ARG,
-            app.resource["patches"]["file_name"],
+            str(temp_folder / app.resource["patches"]["file_name"]),
             self.INTEGRATIONS_ARG,
-            app.resource["integrations"]["file_name"],
+            str(temp_folder / app.resource["integrations"]["file_name"]),
             self.OUTPUT_ARG,
-            app.get_output_file_name(),
+            str(temp_folder / app.output_file_name),
             self.KEYSTORE_ARG,
-            app.keystore_name,
+            str(temp_folder / app.keystore_name),
             self.OPTIONS_ARG,
-            app.options_file,
-        ]
+            str(temp_folder / app.options_file),
+        )
         if app.experiment:
             logger.debug("Using experimental features")
-            args.append(exp)
-        args[1::2] = map(self.config.temp_folder.joinpath, args[1::2])
+            args = (*args, exp)
         if app.old_key and "v4" in version:
             # https://github.com/ReVanced/revanced-cli/issues/272#issuecomment-1740587534
-            old_key_flags = ["--alias=alias", "--keystore-entry-password=ReVanced", "--keystore-password=ReVanced"]
-            args.extend(old_key_flags)
-        if self.config.ci_test:
-            self.exclude_all_patches()
-        if self._PATCHES:
-            args.extend(self._PATCHES)
-        if app.app_name in self.config.rip_libs_apps:
-            excluded = set(possible_archs) - set(app.archs_to_build)
-            for arch in excluded:
-                args.extend(("--rip-lib", arch))
-        start = perf_counter()
-        logger.debug(f"Sending request to revanced cli for building with args java {args}")
-        process = Popen(["java", *args], stdout=PIPE)
+            old_key_flags = ("--alias=alias", "--keystore-entry-password=ReVanced", "--keystore-password=ReVanced")
+            args = (*args, *old_key_flags)
+        patches = self._patches_frozen if self._patches_frozen is not None else self.freeze()
+        return (*args, *patches, *app.rip_lib_args)
+
+    @staticmethod
+    def run_java(args: tuple[str, ...], app_name: str) -> int:
+        """The function `run_java` runs the Revanced CLI and streams its output to the logger.
+
+        Parameters
+        ----------
+        args : tuple[str, ...]
+            The `args` parameter is the tuple of arguments to be passed to `java`.
+        app_name : str
+            The `app_name` parameter is the name of the app being patched, prefixed to every log line.
+
+        Returns
+        -------
+            the exit code of the Revanced CLI process.
+        """
+        logger.debug(f"[{app_name}] Sending request to revanced cli for building with args java {list(args)}")
+        process = Popen(["java", *args], stdout=PIPE, bufsize=1 << 16)
         output = process.stdout
         if not output:
             msg = "Failed to send request for patching."
             raise PatchingFailedError(msg)
-        for line in output:
-            logger.debug(line.decode(encoding='cp949'), flush=True, end="")
-        process.wait()
+        log_debug = logger.debug
+        with TextIOWrapper(output, encoding="cp949", errors="replace") as cli_output:
+            for line in cli_output:
+                log_debug(f"[{app_name}] {line.rstrip()}")
+        return process.wait()
+
+    def patch_app(
+        self: Self,
+        app: APP,
+    ) -> None:
+        """The function `patch_app` is used to patch an app using the Revanced CLI tool.
+
+        Parameters
+        ----------
+        app : APP
+            The `app` parameter is an instance of the `APP` class. It represents an application that needs
+        to be patched.
+        """
+        cli_path = str(self.config.temp_folder / app.resource["cli"]["file_name"])
+        is_new, version = self.is_new_cli(cli_path)
+        args = self.build_args(app, cli_path, is_new, version)
+        start = perf_counter()
+        with self.SHARED_CACHE_CLI_LOCK if self.uses_shared_cache(version) else nullcontext():
+            return_code = self.run_java(args, app.app_name)
+        if return_code:
+            msg = f"Revanced cli exited with code {return_code} while patching {app.app_name}."
+            raise PatchingFailedError(msg)
         logger.info(f"Patching completed for app {app} in {perf_counter() - start:.2f} seconds.")
@@ -28,7 +28,7 @@ default_build = [
     "youtube",
     "youtube_music",
 ]
-possible_archs = ["armeabi-v7a", "x86", "x86_64", "arm64-v8a"]
+possible_archs = frozenset(("armeabi-v7a", "x86", "x86_64", "arm64-v8a"))
 request_header = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (HTML, like Gecko)"
@@ -238,6 +238,26 @@ def apkmirror_status_check(package_name: str) -> Any:
     return response.json()
 
 
+def apkmirror_bulk_status_check(package_names: list[str]) -> dict[str, Any]:
+    """The `apkmirror_bulk_status_check` function checks if multiple apps exist on APKMirror in one request.
+
+    Parameters
+    ----------
+    package_names : list[str]
+        The `package_names` parameter is a list of app package names to check on APKMirror.
+
+    Returns
+    -------
+        a dictionary mapping each package name to its entry in the APKMirror API response.
+    """
+    if not package_names:
+        return {}
+    body = {"pnames": package_names}
+    response = requests.post(APK_MIRROR_APK_CHECK, json=body, headers=request_header, timeout=request_timeout)
+    handle_request_response(response, APK_MIRROR_APK_CHECK)
+    return {app_data["pname"]: app_data for app_data in response.json()["data"]}
+
+
 def contains_any_word(string: str, words: list[str]) -> bool:
     """Checks if a string contains any word."""
     return any(word in string for word in words)